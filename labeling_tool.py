@@ -1,48 +1,377 @@
 import sys
 import json
 import os
+import queue
+from collections import OrderedDict
 import cv2
 import numpy as np
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # numba가 없으면 cv2 / numpy 구현으로 대체
+    HAS_NUMBA = False
 from PyQt5.QtWidgets import (
     QApplication, QLabel, QPushButton, QFileDialog, QVBoxLayout,
-    QWidget, QMessageBox, QScrollArea, QHBoxLayout
+    QWidget, QMessageBox, QScrollArea, QHBoxLayout, QCheckBox
 )
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QPen, QPolygonF
-from PyQt5.QtCore import Qt, QPoint, QPointF
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QImageIOHandler, QPainter, QPen, QPolygon, QPolygonF, QColor, QBrush
+from PyQt5.QtCore import Qt, QPoint, QPointF, QRect, QThread, pyqtSignal
 
 ANNOTATIONS_DIR = "annotations"
 os.makedirs(ANNOTATIONS_DIR, exist_ok=True)
 
+# 미리 디코딩해 둘 다음 이미지 수 / 메모리에 보관할 디코딩된 이미지 수
+PREFETCH_COUNT = 2
+IMAGE_CACHE_SIZE = 6
+
+# JPEG을 1/n 크기로 바로 디코딩하는 imread 플래그 (libjpeg의 DCT 단계 축소 사용)
+REDUCED_READ_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+if HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _fill_polys_numba(mask, poly_offsets, poly_points):
+        """행 단위 병렬 스캔라인 채우기 (폴리곤마다 교차점 짝수/홀수 규칙, 폴리곤끼리는 합집합)
+
+        poly_points: 모든 폴리곤의 꼭짓점을 이어 붙인 (M, 2) int32 배열
+        poly_offsets: i번째 폴리곤이 poly_points[poly_offsets[i]:poly_offsets[i+1]]인 오프셋 표
+        """
+        height, width = mask.shape
+        n_polys = len(poly_offsets) - 1
+        max_edges = 0
+        for p in range(n_polys):
+            max_edges = max(max_edges, poly_offsets[p + 1] - poly_offsets[p])
+
+        for y in prange(height):
+            crossings = np.empty(max_edges, dtype=np.float64)
+            for p in range(n_polys):
+                start, end = poly_offsets[p], poly_offsets[p + 1]
+                n = 0
+                for i in range(start, end):
+                    j = i + 1 if i + 1 < end else start
+                    x0, y0 = poly_points[i, 0], poly_points[i, 1]
+                    x1, y1 = poly_points[j, 0], poly_points[j, 1]
+                    # 반열린 구간 규칙으로 꼭짓점이 두 번 세어지지 않게 함
+                    if (y0 <= y < y1) or (y1 <= y < y0):
+                        crossings[n] = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+                        n += 1
+                if n < 2:
+                    continue
+                xs = np.sort(crossings[:n])
+                for k in range(0, n - 1, 2):
+                    x_start = max(int(np.ceil(xs[k])), 0)
+                    x_end = min(int(np.floor(xs[k + 1])), width - 1)
+                    for x in range(x_start, x_end + 1):
+                        mask[y, x] = 255
+
+def flatten_polygons(polygons):
+    """폴리곤 목록을 (오프셋 표, 이어 붙인 (M, 2) int32 꼭짓점 배열)로 변환"""
+    poly_points = np.ascontiguousarray(np.concatenate(polygons), dtype=np.int32)
+    poly_offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    np.cumsum([len(points) for points in polygons], out=poly_offsets[1:])
+    return poly_offsets, poly_points
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def pip_batch(pts, poly_offsets, poly_xy):
+        """각 점이 들어 있는 폴리곤 번호 반환 (없으면 -1, 겹치면 나중에 그린 폴리곤 우선)"""
+        n_polys = len(poly_offsets) - 1
+        result = np.full(len(pts), -1, dtype=np.int32)
+        for q in range(len(pts)):
+            px, py = pts[q, 0], pts[q, 1]
+            for p in range(n_polys - 1, -1, -1):
+                start, end = poly_offsets[p], poly_offsets[p + 1]
+                inside = False
+                for i in range(start, end):
+                    j = i + 1 if i + 1 < end else start
+                    xi, yi = poly_xy[i, 0], poly_xy[i, 1]
+                    xj, yj = poly_xy[j, 0], poly_xy[j, 1]
+                    if (yi > py) != (yj > py) and px < (xj - xi) * (py - yi) / (yj - yi) + xi:
+                        inside = not inside
+                if inside:
+                    result[q] = p
+                    break
+        return result
+else:
+    def pip_batch(pts, poly_offsets, poly_xy):
+        """각 점이 들어 있는 폴리곤 번호 반환 (없으면 -1, 겹치면 나중에 그린 폴리곤 우선)"""
+        pts = np.asarray(pts, dtype=np.float64)
+        px, py = pts[:, 0:1], pts[:, 1:2]
+        result = np.full(len(pts), -1, dtype=np.int32)
+        for p in range(len(poly_offsets) - 2, -1, -1):
+            poly = poly_xy[poly_offsets[p]:poly_offsets[p + 1]].astype(np.float64)
+            xi, yi = poly[:, 0], poly[:, 1]
+            xj, yj = np.roll(xi, -1), np.roll(yi, -1)
+            crosses = (yi > py) != (yj > py)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_cross = (xj - xi) * (py - yi) / (yj - yi) + xi
+            inside = np.count_nonzero(crosses & (px < x_cross), axis=1) % 2 == 1
+            result[(result == -1) & inside] = p
+        return result
+
+class JitWarmup(QThread):
+    """numba 함수들을 작은 입력으로 미리 컴파일해 첫 클릭/첫 저장이 지연되지 않게 함"""
+
+    def run(self):
+        if not HAS_NUMBA:
+            return
+        poly_offsets, poly_points = flatten_polygons([np.array([[0, 0], [4, 0], [0, 4]], dtype=np.int32)])
+        pip_batch(np.array([[1, 1]], dtype=np.int32), poly_offsets, poly_points)
+        _fill_polys_numba(np.zeros((4, 4), dtype=np.uint8), poly_offsets, poly_points)
+
+def fill_polygons(mask, polygons):
+    """(N, 2) int32 꼭짓점 배열 목록을 mask 위에 255로 채움 (폴리곤들의 합집합)"""
+    if not polygons:
+        return mask
+    contours = [points.reshape(-1, 1, 2) for points in polygons]
+
+    if HAS_NUMBA:
+        poly_offsets, poly_points = flatten_polygons(polygons)
+        _fill_polys_numba(mask, poly_offsets, poly_points)
+        # cv2.fillPoly처럼 경계 픽셀까지 포함되도록 외곽선을 한 번 더 그림
+        cv2.polylines(mask, contours, True, 255)
+        return mask
+
+    # cv2.fillPoly는 여러 윤곽을 한 번에 넘기면 겹치는 영역을 구멍(even-odd)으로 채우므로,
+    # 바운딩 박스가 겹치는 폴리곤이 없을 때만 한 번의 호출로 처리
+    mins = np.array([points.min(axis=0) for points in polygons])
+    maxs = np.array([points.max(axis=0) for points in polygons])
+    overlap = np.all((mins[:, None, :] <= maxs[None, :, :]) & (mins[None, :, :] <= maxs[:, None, :]), axis=2)
+    if np.count_nonzero(overlap) == len(polygons):
+        cv2.fillPoly(mask, contours, 255)
+    else:
+        for contour in contours:
+            cv2.fillPoly(mask, [contour], 255)
+    return mask
+
+def resize_for_display(image, new_width, new_height, high_quality=False):
+    """화면 표시용 축소. 기본은 pyrDown + INTER_LINEAR, high_quality면 INTER_AREA 사용"""
+    if image.shape[:2] == (new_height, new_width):
+        # 이미 화면에 들어가는 크기면 복사 없이 그대로 사용
+        return image
+    if high_quality:
+        return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+
+    # 2배 넘게 줄여야 하면 pyrDown(고정 비용 5탭 필터)으로 목표 크기의 2배 이내까지 먼저 줄임.
+    # 결과는 목표 크기 이상인 가장 작은 피라미드 단계
+    while image.shape[1] >= 2 * new_width and image.shape[0] >= 2 * new_height:
+        image = cv2.pyrDown(image)
+    if image.shape[:2] == (new_height, new_width):
+        # 정확히 2^n배 축소였다면 피라미드 단계를 그대로 사용
+        return image
+    return cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+
+def read_image_size(file_path):
+    """헤더만 읽어 EXIF 회전을 반영한 원본 (너비, 높이) 반환 (알 수 없으면 None)"""
+    reader = QImageReader(file_path)
+    size = reader.size()
+    if not size.isValid():
+        return None
+    width, height = size.width(), size.height()
+    if reader.transformation() & QImageIOHandler.TransformationRotate90:
+        width, height = height, width
+    return width, height
+
+def decode_for_display(file_path, high_quality=False):
+    """이미지 파일을 읽어 (화면(1920x1080)에 맞게 줄인 RGB 배열, 원본 (너비, 높이)) 반환 (실패 시 None)"""
+    screen_width, screen_height = 1920, 1080
+
+    # 큰 JPEG은 목표 크기보다 작아지지 않는 범위에서 1/2, 1/4, 1/8로 줄여서 디코딩
+    reduce = 1
+    original_size = None
+    if file_path.lower().endswith(('.jpg', '.jpeg')):
+        original_size = read_image_size(file_path)
+    if original_size is not None:
+        width, height = original_size
+        scale_factor = min(screen_width / width, screen_height / height, 1.0)
+        new_width, new_height = int(width * scale_factor), int(height * scale_factor)
+        for factor in (8, 4, 2):
+            if width // factor >= new_width and height // factor >= new_height:
+                reduce = factor
+                break
+
+    image = cv2.imread(file_path, REDUCED_READ_FLAGS[reduce])
+    if image is not None and reduce > 1:
+        # 헤더 크기와 디코딩 결과가 맞지 않으면(회전 정보 등) 원본 크기로 다시 디코딩
+        reduced_height, reduced_width = image.shape[:2]
+        if (abs(reduced_width * reduce - width) >= reduce
+                or abs(reduced_height * reduce - height) >= reduce):
+            reduce = 1
+            image = cv2.imread(file_path)
+    if image is None:
+        return None
+    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    if reduce == 1:
+        height, width, _ = image.shape
+    scale_factor = min(screen_width / width, screen_height / height, 1.0)
+    new_width, new_height = int(width * scale_factor), int(height * scale_factor)
+    return resize_for_display(image, new_width, new_height, high_quality), (width, height)
+
+class ImagePrefetcher(QThread):
+    """다음에 볼 이미지들을 백그라운드에서 디코딩/리사이즈해 두는 스레드"""
+    decoded = pyqtSignal(str, bool, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._requests = queue.Queue()
+
+    def request(self, file_path, high_quality):
+        self._requests.put((file_path, high_quality))
+
+    def stop(self):
+        self._requests.put(None)
+        self.wait()
+
+    def run(self):
+        while True:
+            item = self._requests.get()
+            if item is None:
+                break
+            file_path, high_quality = item
+            self.decoded.emit(file_path, high_quality, decode_for_display(file_path, high_quality))
+
 class ImageLabel(QLabel):
+    # 매 paintEvent마다 만들지 않도록 펜/브러시를 한 번만 생성
+    PEN_CONFIRMED = QPen(Qt.red, 2, Qt.SolidLine)
+    # 투명도 0.3을 색상의 알파값(77)에 미리 적용 (setOpacity로 인한 별도 합성 단계 없음)
+    BRUSH_CONFIRMED = QBrush(QColor(255, 0, 0, 77))
+    PEN_CURRENT = QPen(Qt.blue, 2, Qt.SolidLine)
+    PEN_CURRENT_DASHED = QPen(Qt.blue, 2, Qt.DashLine)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMouseTracking(True)
-        # 확정된 폴리곤들을 저장 (points: [(x1,y1), (x2,y2), ...])
+        # 확정된 폴리곤들을 저장 (points: (N, 2) int32 배열,
+        #  qpoly: 안티앨리어싱 채우기용 QPolygonF, qpoly_i: 외곽선용 정수 QPolygon)
         self.polygons = []
-        # 지금 그리고 있는 폴리곤(아직 확정 안 된 점들)
-        self.current_polygon = []
+        # 지금 그리고 있는 폴리곤(아직 확정 안 된 점들) - 미리 할당한 버퍼의 앞 _cur_n개만 사용
+        self._cur_pts = np.empty((256, 2), dtype=np.int32)
+        self._cur_n = 0
+        # 같은 점들을 담은 화면 표시용 QPolygon (매 프레임 새로 만들지 않고 점 추가/삭제 시에만 갱신)
+        self._cur_qpoly = QPolygon()
         self.mouse_position = None
+        # QImage가 참조하는 원본 버퍼 (QImage보다 먼저 해제되지 않도록 보관)
+        self._image_buffer = None
+        # 점-폴리곤 판정용으로 이어 붙인 꼭짓점 배열 (None이면 필요할 때 다시 만듦)
+        self._hit_test_arrays = None
+        # 확정된 폴리곤들을 미리 그려둔 레이어 (None이면 다음 paintEvent에서 다시 그림)
+        self._overlay_cache = None
 
     def setImage(self, cv_image):
         """OpenCV(RGB) 이미지를 QPixmap으로 변환하여 QLabel에 표시"""
-        height, width, channel = cv_image.shape
-        bytes_per_line = 3 * width
-        q_image = QImage(cv_image.data, width, height, bytes_per_line, QImage.Format_RGB888)
+        # QImage는 버퍼를 복사하지 않으므로 연속 메모리로 만든 뒤 참조를 유지
+        buf = np.ascontiguousarray(cv_image)
+        self._image_buffer = buf
+        height, width, channel = buf.shape
+        bytes_per_line = buf.strides[0]
+        q_image = QImage(buf.data, width, height, bytes_per_line, QImage.Format_RGB888)
+        # Qt 래스터 엔진의 기본 경로인 RGB32(4바이트 정렬)로 한 번만 변환해 두어
+        # 매 repaint마다 내부 포맷 변환이 일어나지 않도록 함
+        q_image = q_image.convertToFormat(QImage.Format_RGB32)
         self.setPixmap(QPixmap.fromImage(q_image))
 
         # 폴리곤 정보 초기화
         self.polygons.clear()
-        self.current_polygon.clear()
+        self.clear_current_polygon()
         self.mouse_position = None
+        self.invalidate_overlay()
+
+    @property
+    def current_polygon(self):
+        """그리고 있는 폴리곤의 점들 ((N, 2) int32 배열 뷰)"""
+        return self._cur_pts[:self._cur_n]
+
+    def add_point(self, x, y):
+        """그리고 있는 폴리곤에 점 추가 (버퍼가 차면 두 배로 늘림)"""
+        if self._cur_n == len(self._cur_pts):
+            grown = np.empty((2 * len(self._cur_pts), 2), dtype=np.int32)
+            grown[:self._cur_n] = self._cur_pts
+            self._cur_pts = grown
+        self._cur_pts[self._cur_n] = (x, y)
+        self._cur_n += 1
+        self._cur_qpoly.append(QPoint(x, y))
+
+    def pop_point(self):
+        """그리고 있는 폴리곤의 마지막 점 제거"""
+        if self._cur_n:
+            self._cur_n -= 1
+            self._cur_qpoly.remove(self._cur_n)
+
+    def clear_current_polygon(self):
+        self._cur_n = 0
+        self._cur_qpoly.clear()
+
+    def invalidate_overlay(self):
+        """폴리곤 삭제/이미지 변경 시 캐시된 오버레이를 버리고 전체를 다시 그리도록 요청"""
+        self._overlay_cache = None
+        self._hit_test_arrays = None
+        self.update()
+
+    def add_polygon(self, polygon_data):
+        """확정된 폴리곤 추가. 오버레이는 다시 만들지 않고 새 폴리곤만 덧그림"""
+        self.polygons.append(polygon_data)
+        self._hit_test_arrays = None
+        if self._overlay_cache is not None:
+            painter = QPainter(self._overlay_cache)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._paint_polygons(painter, [polygon_data])
+            painter.end()
         self.update()
 
+    def find_polygon_at(self, x, y):
+        """(x, y)를 포함하는 확정된 폴리곤의 번호 반환 (없으면 -1)"""
+        if not self.polygons:
+            return -1
+        if self._hit_test_arrays is None:
+            self._hit_test_arrays = flatten_polygons([poly_data["points"] for poly_data in self.polygons])
+        poly_offsets, poly_points = self._hit_test_arrays
+        return int(pip_batch(np.array([[x, y]], dtype=np.int32), poly_offsets, poly_points)[0])
+
+    def _rebuild_overlay(self):
+        """확정된 폴리곤들(빨간색)을 투명 레이어 위에 한 번만 그려서 캐시"""
+        # 반투명 채우기는 premultiplied ARGB에서 가장 빠르게 합성됨
+        size = self.pixmap().size()
+        overlay = QImage(size.width(), size.height(), QImage.Format_ARGB32_Premultiplied)
+        overlay.fill(0)
+
+        painter = QPainter(overlay)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._paint_polygons(painter, self.polygons)
+        painter.end()
+
+        self._overlay_cache = QPixmap.fromImage(overlay)
+
+    def _paint_polygons(self, painter, polygons):
+        """확정된 폴리곤들을 painter에 그림 (반투명 채우기 + 외곽선)"""
+        painter.setPen(self.PEN_CONFIRMED)
+        for poly_data in polygons:
+            polygon_q = poly_data["qpoly"]
+            outline_q = poly_data["qpoly_i"]
+            if len(polygon_q) >= 3:
+                # 채우기
+                painter.setBrush(self.BRUSH_CONFIRMED)
+                painter.drawPolygon(polygon_q)
+
+                # 폴리곤 외곽선 그리기 (정수 좌표 경로)
+                painter.setBrush(Qt.NoBrush)
+                painter.drawPolygon(outline_q)
+            else:
+                # 점이 2개 이하라면 그냥 선만 표시
+                painter.drawPolyline(outline_q)
+
     def mousePressEvent(self, event):
         """마우스 클릭 시 현재 폴리곤에 점 추가"""
         if self.pixmap() is not None and event.button() == Qt.LeftButton:
             x, y = event.pos().x(), event.pos().y()
             # 이미지 범위 안에서만 점 추가
             if 0 <= x < self.pixmap().width() and 0 <= y < self.pixmap().height():
-                self.current_polygon.append((x, y))
+                self.add_point(x, y)
                 self.update()
 
     def mouseMoveEvent(self, event):
@@ -50,8 +379,23 @@ class ImageLabel(QLabel):
         if self.pixmap() is not None:
             x, y = event.pos().x(), event.pos().y()
             if 0 <= x < self.pixmap().width() and 0 <= y < self.pixmap().height():
+                previous_position = self.mouse_position
                 self.mouse_position = (x, y)
-                self.update()
+                if not self._cur_n:
+                    # 그리고 있는 폴리곤이 없으면 점선도 없으므로 다시 그릴 필요 없음
+                    return
+
+                # 이전 점선과 새 점선이 지나는 영역만 다시 그림
+                last_point = self._cur_qpoly.last()
+                dirty = self._segment_rect(last_point, QPoint(x, y))
+                if previous_position is not None:
+                    dirty = dirty.united(self._segment_rect(last_point, QPoint(*previous_position)))
+                self.update(dirty)
+
+    @staticmethod
+    def _segment_rect(p1, p2):
+        """두 점을 잇는 선분을 펜 두께(+안티앨리어싱 여유)까지 포함해 덮는 사각형"""
+        return QRect(p1, p2).normalized().adjusted(-3, -3, 3, 3)
 
     def paintEvent(self, event):
         """확정된 폴리곤 + 그리고 있는 폴리곤을 화면에 그려줌"""
@@ -61,40 +405,28 @@ class ImageLabel(QLabel):
 
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-
-        # 1) 이미 확정된 폴리곤들 (빨간색)
-        pen_confirmed = QPen(Qt.red, 2, Qt.SolidLine)
-        painter.setPen(pen_confirmed)
-        for poly_data in self.polygons:
-            points = poly_data["points"]
-            if len(points) >= 3:
-                polygon_q = QPolygonF([QPointF(x, y) for x, y in points])
-                painter.setBrush(Qt.red)
-                painter.setOpacity(0.3)
-                painter.drawPolygon(polygon_q)
-                painter.setOpacity(1.0)
-
-                # 폴리곤 외곽선 그리기
-                for i in range(len(points)):
-                    p1 = points[i]
-                    p2 = points[(i+1) % len(points)]
-                    painter.drawLine(QPoint(*p1), QPoint(*p2))
-            else:
-                # 점이 2개 이하라면 그냥 선만 표시
-                for i in range(len(points) - 1):
-                    painter.drawLine(QPoint(*points[i]), QPoint(*points[i+1]))
+        # 스크롤 시 QScrollArea는 이미 그려진 부분을 그대로 옮기고(blit) 새로 드러난 띠만
+        # 다시 그리도록 요청하므로, 요청된 영역(region)에만 그림
+        region = event.region()
+        painter.setClipRegion(region)
+
+        # 1) 이미 확정된 폴리곤들 (빨간색) - 캐시된 레이어에서 필요한 부분만 붙임
+        if self._overlay_cache is None:
+            self._rebuild_overlay()
+        overlay_rect = self._overlay_cache.rect()
+        for rect in region.rects():
+            rect = rect.intersected(overlay_rect)
+            if not rect.isEmpty():
+                painter.drawPixmap(rect, self._overlay_cache, rect)
 
         # 2) 현재 그리고 있는 폴리곤 (파란색)
-        if self.current_polygon:
-            pen_current = QPen(Qt.blue, 2, Qt.SolidLine)
-            painter.setPen(pen_current)
-            for i in range(len(self.current_polygon) - 1):
-                painter.drawLine(QPoint(*self.current_polygon[i]), QPoint(*self.current_polygon[i+1]))
+        if self._cur_n:
+            painter.setPen(self.PEN_CURRENT)
+            painter.drawPolyline(self._cur_qpoly)
 
             if self.mouse_position:
-                dashed_pen = QPen(Qt.blue, 2, Qt.DashLine)
-                painter.setPen(dashed_pen)
-                painter.drawLine(QPoint(*self.current_polygon[-1]), QPoint(*self.mouse_position))
+                painter.setPen(self.PEN_CURRENT_DASHED)
+                painter.drawLine(self._cur_qpoly.last(), QPoint(*self.mouse_position))
 
 class SegmentationTool(QWidget):
     def __init__(self):
@@ -105,6 +437,18 @@ class SegmentationTool(QWidget):
         self.image_files = []
         self.current_image_index = 0
         self.current_image_path = None
+        # 현재 이미지의 원본 해상도 (너비, 높이) - 마스크는 이 크기로 저장
+        self.current_image_size = None
+
+        # (경로, 고화질 여부) -> (디코딩된 RGB 배열, 원본 크기) (LRU)
+        self._image_cache = OrderedDict()
+        self._pending_prefetch = set()
+        self._prefetcher = ImagePrefetcher(self)
+        self._prefetcher.decoded.connect(self._on_image_decoded)
+        self._prefetcher.start()
+
+        self._jit_warmup = JitWarmup(self)
+        self._jit_warmup.start()
 
         self.image_label = ImageLabel()
         self.image_label.setAlignment(Qt.AlignCenter)
@@ -134,6 +478,9 @@ class SegmentationTool(QWidget):
         self.btn_finalize_polygon = QPushButton("폴리곤 확정")
         self.btn_finalize_polygon.clicked.connect(self.finalize_polygon)
 
+        # 체크 시 다음에 불러오는 이미지부터 INTER_AREA로 축소 (느리지만 화질이 좋음)
+        self.chk_high_quality = QCheckBox("고화질 미리보기")
+
         # 레이아웃 구성
         layout_main = QVBoxLayout()
         layout_main.addWidget(self.scroll_area)
@@ -142,6 +489,7 @@ class SegmentationTool(QWidget):
         layout_controls.addWidget(self.btn_open)
         layout_controls.addWidget(self.btn_next)
         layout_controls.addWidget(self.btn_save_mask)
+        layout_controls.addWidget(self.chk_high_quality)
 
         layout_polygon = QHBoxLayout()
         layout_polygon.addWidget(self.btn_undo_point)
@@ -157,13 +505,16 @@ class SegmentationTool(QWidget):
         """이미지 폴더 선택 후 이미지 파일 리스트 불러오기"""
         folder_path = QFileDialog.getExistingDirectory(self, "이미지 폴더 선택")
         if folder_path:
-            self.image_files = [
-                os.path.join(folder_path, f)
-                for f in os.listdir(folder_path)
-                if os.path.isfile(os.path.join(folder_path, f))
-                and f.lower().endswith(('.jpg', '.jpeg', '.png'))
-            ]
+            # scandir의 DirEntry는 디렉터리 조회 시 받은 정보로 파일 여부를 판단하므로 파일마다 stat하지 않음
+            with os.scandir(folder_path) as entries:
+                self.image_files = sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.is_file()
+                    and entry.name.lower().endswith(('.jpg', '.jpeg', '.png'))
+                )
             if self.image_files:
+                self._image_cache.clear()
                 self.current_image_index = 0
                 self.load_image(self.image_files[self.current_image_index])
                 self.btn_next.setEnabled(True)
@@ -172,21 +523,43 @@ class SegmentationTool(QWidget):
                 QMessageBox.warning(self, "경고", "선택한 폴더에 이미지 파일이 없습니다.")
 
     def load_image(self, file_path):
-        """단일 이미지 로드 및 화면에 맞게 리사이즈"""
+        """단일 이미지 로드 및 화면에 맞게 리사이즈 (미리 디코딩된 이미지가 있으면 그대로 사용)"""
         self.current_image_path = file_path
-        image = cv2.imread(file_path)
-        if image is None:
-            QMessageBox.warning(self, "오류", "이미지를 불러올 수 없습니다.")
-            return
-        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
-        screen_width, screen_height = 1920, 1080
-        height, width, _ = image.shape
-        scale_factor = min(screen_width / width, screen_height / height, 1.0)
-        new_width, new_height = int(width * scale_factor), int(height * scale_factor)
-        resized = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
-
+        high_quality = self.chk_high_quality.isChecked()
+        key = (file_path, high_quality)
+        decoded = self._image_cache.get(key)
+        if decoded is None:
+            decoded = decode_for_display(file_path, high_quality)
+            if decoded is None:
+                QMessageBox.warning(self, "오류", "이미지를 불러올 수 없습니다.")
+                return
+        self._cache_image(key, decoded)
+
+        resized, self.current_image_size = decoded
         self.image_label.setImage(resized)
+        self._prefetch_next_images()
+
+    def _cache_image(self, key, decoded):
+        self._image_cache[key] = decoded
+        self._image_cache.move_to_end(key)
+        while len(self._image_cache) > IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+
+    def _prefetch_next_images(self):
+        """현재 이미지 다음 PREFETCH_COUNT장을 백그라운드 디코딩 요청"""
+        high_quality = self.chk_high_quality.isChecked()
+        start = self.current_image_index + 1
+        for file_path in self.image_files[start:start + PREFETCH_COUNT]:
+            key = (file_path, high_quality)
+            if key not in self._image_cache and key not in self._pending_prefetch:
+                self._pending_prefetch.add(key)
+                self._prefetcher.request(file_path, high_quality)
+
+    def _on_image_decoded(self, file_path, high_quality, decoded):
+        key = (file_path, high_quality)
+        self._pending_prefetch.discard(key)
+        if decoded is not None and file_path in self.image_files:
+            self._cache_image(key, decoded)
 
     def load_next_image(self):
         """다음 이미지 로드"""
@@ -198,15 +571,15 @@ class SegmentationTool(QWidget):
 
     def undo_last_point(self):
         """현재 그리고 있는 폴리곤의 마지막 점 되돌리기"""
-        if self.image_label.current_polygon:
-            self.image_label.current_polygon.pop()
+        if len(self.image_label.current_polygon):
+            self.image_label.pop_point()
             self.image_label.update()
 
     def undo_last_polygon(self):
         """마지막으로 확정된 폴리곤 삭제"""
         if self.image_label.polygons:
             self.image_label.polygons.pop()
-            self.image_label.update()
+            self.image_label.invalidate_overlay()
 
     def finalize_polygon(self):
         """현재 그리고 있는 폴리곤을 확정하여 목록에 저장"""
@@ -214,12 +587,16 @@ class SegmentationTool(QWidget):
             QMessageBox.warning(self, "폴리곤 오류", "폴리곤은 최소 3개 이상의 점이 필요합니다.")
             return
 
+        # 꼭짓점은 연속된 (N, 2) int32 배열로 보관해 마스크 생성 시 변환 없이 사용
+        points = self.image_label.current_polygon.copy()
         polygon_data = {
-            "points": self.image_label.current_polygon.copy()
+            "points": points,
+            # 매 프레임마다 만들지 않도록 확정 시점에 한 번만 생성
+            "qpoly": QPolygonF([QPointF(x, y) for x, y in points.tolist()]),
+            "qpoly_i": QPolygon([QPoint(x, y) for x, y in points.tolist()])
         }
-        self.image_label.polygons.append(polygon_data)
-        self.image_label.current_polygon.clear()
-        self.image_label.update()
+        self.image_label.clear_current_polygon()
+        self.image_label.add_polygon(polygon_data)
 
     def save_mask(self):
         """폴리곤을 채운 흑백(이진) 마스크 이미지를 annotations 폴더에 저장"""
@@ -231,32 +608,46 @@ class SegmentationTool(QWidget):
             QMessageBox.warning(self, "오류", "저장할 폴리곤이 없습니다.")
             return
 
-        # 현재 표시 중인 Pixmap 크기에 맞춰서 마스크 생성
         pixmap = self.image_label.pixmap()
         if pixmap is None:
             QMessageBox.warning(self, "오류", "화면에 표시된 이미지가 없습니다.")
             return
 
-        mask_width = pixmap.width()
-        mask_height = pixmap.height()
+        # 마스크는 화면 표시 크기가 아니라 원본 이미지 해상도로 생성
+        mask_width, mask_height = self.current_image_size
+        ratio = np.array([mask_width / pixmap.width(), mask_height / pixmap.height()])
 
         # 검은색 배경(0)으로 초기화된 마스크
         mask = np.zeros((mask_height, mask_width), dtype=np.uint8)
 
-        # 폴리곤을 하얀색(255)으로 채움
+        # 화면 좌표(픽셀 중심 기준)를 원본 좌표로 변환한 뒤 폴리곤을 하얀색(255)으로 채움
+        polygons = []
         for poly_data in self.image_label.polygons:
-            points = np.array(poly_data["points"], np.int32)
-            points = points.reshape((-1, 1, 2))
-            cv2.fillPoly(mask, [points], 255)
+            points = np.rint((poly_data["points"] + 0.5) * ratio - 0.5)
+            points = np.clip(points, 0, [mask_width - 1, mask_height - 1]).astype(np.int32)
+            polygons.append(points)
+        fill_polygons(mask, polygons)
 
         # 마스크 이미지 저장
         filename = os.path.basename(self.current_image_path)
         mask_filename = os.path.splitext(filename)[0] + "_mask.png"
         mask_path = os.path.join(ANNOTATIONS_DIR, mask_filename)
 
-        cv2.imwrite(mask_path, mask)
+        # 이진 마스크는 압축 레벨 1로도 크기가 거의 같으므로 인코딩 CPU 비용을 줄이고,
+        # 1비트(bilevel) PNG로 저장해 zlib이 처리할 데이터를 8배 줄임 (읽으면 0/255로 복원됨)
+        ok, buf = cv2.imencode(".png", mask, [cv2.IMWRITE_PNG_COMPRESSION, 1, cv2.IMWRITE_PNG_BILEVEL, 1])
+        if not ok:
+            QMessageBox.warning(self, "오류", "마스크 이미지를 인코딩할 수 없습니다.")
+            return
+        with open(mask_path, "wb") as f:
+            f.write(buf.tobytes())
         QMessageBox.information(self, "저장 완료", f"마스크 파일이 저장되었습니다:\n{mask_path}")
 
+    def closeEvent(self, event):
+        self._prefetcher.stop()
+        self._jit_warmup.wait()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     tool = SegmentationTool()